@@ -2,9 +2,9 @@ from __future__ import print_function
 
 import platform
 import sys
-import time
+from timeit import default_timer as timer
 
-from goless import backends, chan, go, selecting
+from goless import backends, chan, debug, go, selecting
 from goless.compat import range
 
 
@@ -26,11 +26,11 @@ def bench_channel(chan_size):
     count = 0
 
     go(func)
-    start = time.clock()
+    start = timer()
     for _ in range(QUEUE_LEN):
         c.recv()
         count += 1
-    end = time.clock()
+    end = timer()
     return end - start
 
 
@@ -40,6 +40,18 @@ def bench_channels():
         write_result(name, took)
 
 
+def bench_channels_debug():
+    """Runs the channel benchmarks with debug mode on,
+    to show the cost of validating channel state."""
+    debug(True)
+    try:
+        for size, name in CHANSIZE_AND_NAMES:
+            took = bench_channel(size)
+            write_result(name + '_debug', took)
+    finally:
+        debug(False)
+
+
 def bench_select(use_default):
     c = chan(0)
     cases = [
@@ -57,10 +69,10 @@ def bench_select(use_default):
             c.recv()
     go(sender)
 
-    start = time.clock()
+    start = timer()
     for _ in range(QUEUE_LEN):
         selecting.select(cases)
-    end = time.clock()
+    end = timer()
     return end - start
 
 
@@ -97,6 +109,7 @@ def prime():
     WRITE_ENABLED = False
     for _ in range(count):
         bench_channels()
+        bench_channels_debug()
         bench_selects()
     WRITE_ENABLED = True
 
@@ -104,6 +117,7 @@ def prime():
 def main():
     prime()
     bench_channels()
+    bench_channels_debug()
     bench_selects()
 
 
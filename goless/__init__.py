@@ -15,11 +15,18 @@ import sys as _sys
 import traceback as _traceback
 
 from .backends import current as _be, Deadlock, GolessException
+from . import channels as _channels
 
 # noinspection PyUnresolvedReferences
 from .channels import chan, ChannelClosed
 # noinspection PyUnresolvedReferences
 from .selecting import dcase, rcase, scase, select
+# noinspection PyUnresolvedReferences
+from .pools import Pool
+# noinspection PyUnresolvedReferences
+from .offload import go_process, go_thread
+# noinspection PyUnresolvedReferences
+from .processchannels import process_chan
 
 
 version_info = 0, 7, 3
@@ -60,3 +67,18 @@ def go(func, *args, **kwargs):
             on_panic(*_sys.exc_info())
 
     _be.start(safe_wrapped, func)
+
+
+def debug(enabled=True):
+    """
+    Turn debug mode on or off.
+    In debug mode, channels validate their internal state
+    on every operation, and raise an ``AssertionError``
+    if it is invalid.
+    This is useful when working on goless itself,
+    but makes channel operations slower.
+
+    Debug mode is off by default,
+    unless the ``GOLESS_DEBUG`` environment variable is set.
+    """
+    _channels._debug = enabled
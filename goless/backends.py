@@ -1,8 +1,8 @@
 import contextlib as _contextlib
-import gc as _gc
 import os as _os
 import platform as _platform
 import sys as _sys
+import threading as _threading
 
 from . import compat
 
@@ -43,6 +43,22 @@ class Backend(object):
         """Returns a new channel."""
         raise NotImplementedError()
 
+    def waiter(self):
+        """Returns a new one-shot waiter.
+        ``waiter.wait()`` blocks the current tasklet/greenlet until
+        ``waiter.wake(value)`` is called, and returns ``value``.
+        ``wake`` never blocks or switches tasklets,
+        it only makes the waiting tasklet runnable.
+        Only the first call to ``wake`` has any effect.
+        """
+        raise NotImplementedError()
+
+    def call_in_thread(self, func, *args, **kwargs):
+        """Calls ``func(*args, **kwargs)`` in an OS thread,
+        blocking only the current tasklet/greenlet until it finishes.
+        Returns the result of ``func``, or raises its exception."""
+        raise NotImplementedError()
+
     def yield_(self):
         """Yields control for other tasklets/greenlets to run.
         If none are available, do nothing.
@@ -78,6 +94,29 @@ def _make_stackless():  # pragma: no cover
             with as_deadlock(RuntimeError):
                 return stackless.channel.receive(self)
 
+    class StacklessWaiter(object):
+        def __init__(self):
+            self._chan = stackless.channel()
+            # Make the woken tasklet runnable but keep running the waker.
+            self._chan.preference = 0
+            self._woken = False
+            self._value = None
+
+        def wait(self):
+            if self._woken:
+                return self._value
+            with as_deadlock(RuntimeError):
+                return self._chan.receive()
+
+        def wake(self, value=None):
+            if self._woken:
+                return
+            self._woken = True
+            if self._chan.balance < 0:
+                self._chan.send(value)
+            else:
+                self._value = value
+
     class StacklessBackend(Backend):
         def shortname(self):
             return 'stackless'
@@ -93,6 +132,26 @@ def _make_stackless():  # pragma: no cover
         def channel(self):
             return StacklessChannel()
 
+        def waiter(self):
+            return StacklessWaiter()
+
+        def call_in_thread(self, func, *args, **kwargs):
+            # Stackless channels can be used between threads,
+            # so the thread sends its result over one.
+            result = stackless.channel()
+
+            def run():
+                try:
+                    result.send((True, func(*args, **kwargs)))
+                except Exception as ex:
+                    result.send((False, ex))
+
+            _threading.Thread(target=run).start()
+            succeeded, value = result.receive()
+            if succeeded:
+                return value
+            raise value
+
         def yield_(self):
             try:
                 return stackless.schedule()
@@ -119,7 +178,6 @@ def _make_gevent():
     import gevent
     import gevent.hub
     import gevent.queue
-    import greenlet
     
     # We're importing socket to handle an known error in libev on Windows
     # See rgalanakis/goless#28 and surfly/gevent#459
@@ -138,12 +196,43 @@ def _make_gevent():
             with as_deadlock(deadlock_errtypes):
                 return self.get()
 
+    class Waiter(object):
+        def __init__(self):
+            self._waiter = gevent.hub.Waiter()
+            self._woken = False
+
+        def wait(self):
+            with as_deadlock(deadlock_errtypes):
+                return self._waiter.get()
+
+        def wake(self, value=None):
+            if self._woken:
+                return
+            self._woken = True
+            # gevent's Waiter can only be switched to from the Hub,
+            # which also keeps the waker from being switched out.
+            gevent.get_hub().loop.run_callback(self._waiter.switch, value)
+
     class GeventBackend(Backend):
+        def __init__(self):
+            # Number of greenlets started through the backend
+            # that have not yet finished.
+            # gevent has no cheap way to count live greenlets,
+            # so we track them ourselves for would_deadlock.
+            self._alive = 0
+
         def shortname(self):
             return 'gevent'  # pragma: no cover
 
+        def _run_counted(self, func, args, kwargs):
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._alive -= 1
+
         def start(self, func, *args, **kwargs):
-            grnlet = gevent.spawn(func, *args, **kwargs)
+            grnlet = gevent.spawn(self._run_counted, func, args, kwargs)
+            self._alive += 1
             return grnlet
 
         def run(self, func, *args, **kwargs):
@@ -154,6 +243,12 @@ def _make_gevent():
         def channel(self):
             return Channel()
 
+        def waiter(self):
+            return Waiter()
+
+        def call_in_thread(self, func, *args, **kwargs):
+            return gevent.get_hub().threadpool.apply(func, args, kwargs)
+
         def yield_(self):
             with as_deadlock(gevent.hub.LoopExit):
                 gevent.sleep()
@@ -166,14 +261,8 @@ def _make_gevent():
 
         def would_deadlock(self):
             # The Hub and main greenlet are always running,
-            # if there are more than those alive, we aren't going to deadlock.
-            count = 0
-            for obj in _gc.get_objects():
-                if isinstance(obj, greenlet.greenlet) and not obj.dead:
-                    count += 1
-                    if count > 2:
-                        return False
-            return True
+            # if any of our greenlets are alive, we aren't going to deadlock.
+            return self._alive == 0
 
     return GeventBackend()
 
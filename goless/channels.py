@@ -1,4 +1,6 @@
 import collections as _collections
+import itertools as _itertools
+import os as _os
 
 from .backends import current as _be, GolessException as _GolessException
 from .compat import range as _range, maxint as _maxint, PY3 as _PY3
@@ -10,6 +12,15 @@ class ChannelClosed(_GolessException):
     """
 
 
+# Value blocked senders and receivers are woken with
+# when the channel is closed.
+_closed = object()
+
+# When True, channels validate their internal state on every operation.
+# See goless.debug.
+_debug = bool(_os.getenv('GOLESS_DEBUG'))
+
+
 class GoChannel(object):
     """
     A **Go**-like channel that can be sent to, received from,
@@ -19,6 +30,7 @@ class GoChannel(object):
     """
     def __init__(self):
         self._closed = False
+        self._waiters = []
 
     def send(self, value=None):
         """
@@ -56,6 +68,55 @@ class GoChannel(object):
     def _recv(self):
         raise NotImplementedError()
 
+    def send_many(self, values):
+        """
+        Sends each item in the iterable ``values``, in order.
+        Behaves like calling ``send`` for each value,
+        including blocking, but values that fit in the buffer
+        are added in bulk, which is much cheaper.
+
+        If the channel is already closed, or closes before all values
+        are sent, :class:`goless.ChannelClosed` will be raised.
+        """
+        if self._closed:
+            raise ChannelClosed()
+        self._send_many(values)
+
+    def _send_many(self, values):
+        for value in values:
+            self.send(value)
+
+    def recv_many(self, max_n, block=True):
+        """
+        Receive up to ``max_n`` values from the channel,
+        and return them as a list.
+        All values that are available without blocking are received,
+        up to ``max_n``.
+        If no value is available and ``block`` is True,
+        block until one is (like ``recv``).
+        If ``block`` is False, an empty list is returned instead.
+
+        If the channel is closed and no values are available,
+        :class:`goless.ChannelClosed` will be raised.
+        """
+        assert max_n > 0
+        if self.recv_ready():
+            return self._recv_many(max_n)
+        if block:
+            values = [self.recv()]
+            if max_n > 1:
+                values.extend(self._recv_many(max_n - 1))
+            return values
+        if self._closed:
+            raise ChannelClosed()
+        return []
+
+    def _recv_many(self, max_n):
+        values = []
+        while len(values) < max_n and self.recv_ready():
+            values.append(self._recv())
+        return values
+
     def recv_ready(self):
         """
         Return True if there is a sender waiting,
@@ -79,6 +140,24 @@ class GoChannel(object):
         will raise :class:`goless.ChannelClosed`.
         """
         self._closed = True
+        self._notify_waiters()
+
+    def _add_waiter(self, waiter):
+        """
+        Registers a backend waiter (see :meth:`goless.backends.Backend.waiter`)
+        to be woken whenever the channel may have become
+        ready to send or receive.
+        Used by :func:`goless.select` so it can block
+        instead of polling the channel.
+        """
+        self._waiters.append(waiter)
+
+    def _remove_waiter(self, waiter):
+        self._waiters.remove(waiter)
+
+    def _notify_waiters(self):
+        for waiter in self._waiters:
+            waiter.wake()
 
     def __iter__(self):
         return self
@@ -99,27 +178,33 @@ class GoChannel(object):
 
 class BufferedChannel(GoChannel):
     """
-    BufferedChannel has several situations it must handle.
+    BufferedChannel keeps its own buffer and its own queues of
+    blocked senders and receivers.
+    Blocked tasklets wait on a backend waiter
+    (see :meth:`goless.backends.Backend.waiter`),
+    and are woken directly, one at a time,
+    so sends and receives that do not block never touch the backend.
 
     When sending:
 
-    1. If there is a receiver waiting send the value through the channel.
+    1. If there is a receiver waiting, hand the value to it directly,
+       and yield so it can run.
        A waiting receiver indicates the buffer was empty.
-       It's uncertain in this case if there will be a context switch 
-       (blocking the current task) or not.
-    2. Else if there is no more room in the buffer,
-       also send the value through the channel,
-       blocking until a receiver for the value is available.
-    3. Otherwise just append the value to the deque returning immediately.
+    2. Else if there is room in the buffer,
+       append the value to the deque returning immediately.
+    3. Otherwise queue the value and block until a receiver takes it.
 
     When receiving:
 
     1. If the buffer has items, pop and return the first value.
        Before returning, if there is a sender waiting,
-       receive its value and append it to the buffer.
-    2. Else just receive on the channel,
-       blocking until a sender is available.
-       Return the value from the sender.
+       move its value into the buffer and wake it up.
+    2. Else if there is a sender waiting (only possible for an
+       unbuffered channel), take its value and wake it up.
+    3. Otherwise block until a sender hands us a value.
+
+    Waking a blocked sender never switches tasklets,
+    so the receiver keeps running.
     """
 
     def __init__(self, size):
@@ -127,64 +212,149 @@ class BufferedChannel(GoChannel):
         GoChannel.__init__(self)
         self.maxsize = size
         self.values_deque = _collections.deque() if size else ()
-        self.waiting_chan = _be.channel()
+        # Waiters for blocked receivers,
+        # and (waiter, value) pairs for blocked senders.
+        self._recvq = _collections.deque()
+        self._sendq = _collections.deque()
 
-    def _send(self, value):
+    def _check_invariants(self):
+        """
+        Raises an AssertionError if the channel is in an invalid state.
+        Only called in debug mode (see :func:`goless.debug`).
+        """
         buffer_size = len(self.values_deque)
-        chan_balance = self.waiting_chan.balance
-        assert buffer_size <= self.maxsize
-        assert ((chan_balance < 0 and buffer_size == 0)
-                or (chan_balance > 0 and buffer_size == self.maxsize)
-                or chan_balance == 0)
-        if chan_balance < 0 or buffer_size == self.maxsize:
-            self.waiting_chan.send(value)
-            if self._closed:
-                raise ChannelClosed("Channel closed while sending")
-        else:
-            assert buffer_size < self.maxsize
+        if buffer_size > self.maxsize:
+            raise AssertionError('Buffer has %s items but maxsize is %s.'
+                                 % (buffer_size, self.maxsize))
+        # Receivers only block on an empty buffer,
+        # and senders only block on a full one.
+        if self._recvq and buffer_size:
+            raise AssertionError('Receivers waiting but buffer has items.')
+        if self._sendq and buffer_size < self.maxsize:
+            raise AssertionError('Senders waiting but buffer has room.')
+
+    def _send(self, value):
+        if _debug:
+            self._check_invariants()
+        if self._recvq:
+            self._recvq.popleft().wake(value)
+            _be.yield_()
+        elif len(self.values_deque) < self.maxsize:
             self.values_deque.append(value)
+            if self._waiters:
+                self._notify_waiters()
+        else:
+            waiter = _be.waiter()
+            item = (waiter, value)
+            self._sendq.append(item)
+            if self._waiters:
+                self._notify_waiters()
+            try:
+                result = waiter.wait()
+            except BaseException:
+                self._sendq.remove(item)
+                raise
+            if result is _closed:
+                raise ChannelClosed("Channel closed while sending")
 
     def _recv(self):
+        if _debug:
+            self._check_invariants()
         if self.values_deque:
             value = self.values_deque.popleft()
-            if self.waiting_chan.balance > 0:
-                self.values_deque.append(self.waiting_chan.receive())
-        else:
-            value = self.waiting_chan.receive()
-            if self._closed:
-                raise ChannelClosed("Channel closed while receiving")
+            if self._sendq:
+                waiter, sendvalue = self._sendq.popleft()
+                self.values_deque.append(sendvalue)
+                waiter.wake()
+            elif self._waiters:
+                self._notify_waiters()
+            return value
+        if self._sendq:
+            waiter, value = self._sendq.popleft()
+            waiter.wake()
+            return value
+        waiter = _be.waiter()
+        self._recvq.append(waiter)
+        if self._waiters:
+            self._notify_waiters()
+        try:
+            value = waiter.wait()
+        except BaseException:
+            self._recvq.remove(waiter)
+            raise
+        if value is _closed:
+            raise ChannelClosed("Channel closed while receiving")
         return value
 
+    def _send_many(self, values):
+        # Unlike send, we don't yield to each receiver we hand a value to,
+        # but only once we're done or are about to block,
+        # so the rest of the values can be buffered in bulk.
+        if _debug:
+            self._check_invariants()
+        values = iter(values)
+        woke_receivers = False
+        for value in values:
+            if self._closed:
+                raise ChannelClosed()
+            if self._recvq:
+                self._recvq.popleft().wake(value)
+                woke_receivers = True
+                continue
+            room = self.maxsize - len(self.values_deque)
+            if room:
+                self.values_deque.append(value)
+                self.values_deque.extend(_itertools.islice(values, room - 1))
+                if self._waiters:
+                    self._notify_waiters()
+            else:
+                # Blocking lets any receivers we woke run.
+                self._send(value)
+                woke_receivers = False
+        if woke_receivers:
+            _be.yield_()
+
+    def _recv_many(self, max_n):
+        if _debug:
+            self._check_invariants()
+        buf = self.values_deque
+        values = [buf.popleft() for _ in _range(min(max_n, len(buf)))]
+        # If we still want more, the buffer is empty,
+        # so take values directly from blocked senders.
+        # Otherwise move their values into the room we made in the buffer.
+        sendq = self._sendq
+        while sendq and len(values) < max_n:
+            waiter, value = sendq.popleft()
+            values.append(value)
+            waiter.wake()
+        while sendq and len(buf) < self.maxsize:
+            waiter, value = sendq.popleft()
+            buf.append(value)
+            waiter.wake()
+        if self._waiters:
+            self._notify_waiters()
+        return values
+
     def recv_ready(self):
-        return self.values_deque or self.waiting_chan.balance > 0
+        return bool(self.values_deque or self._sendq)
 
     def send_ready(self):
         room_in_queue = len(self.values_deque) < self.maxsize
         if room_in_queue:
             return True
-        receivers_waiting = self.waiting_chan.balance < 0
+        receivers_waiting = bool(self._recvq)
         return receivers_waiting
 
     def close(self):
-        # This next yield gives a chance to all blocked receivers to return
-        # before the channel is actually closed.
-        # We think this is more "fair",
-        # as these are blocking-but-ready tasklets that should have
-        # the opportunity to finish.
-        # Otherwise, for example, a sender could successfully send
-        # but still get a ChannelClosed error.
-        _be.yield_()
-        # To make sure all pending tasklets are woken up,
-        # we mark the channel closed and then spam out sends or
-        # receives if needed.
-        # The tasklets will wake up, see the channel is closed,
-        # and raise a ChannelClosed error.
         GoChannel.close(self)
-        balance = self.waiting_chan.balance
-        for _ in _range(balance, 0):
-            self.waiting_chan.send(None)
-        for _ in _range(balance):
-            self.waiting_chan.receive()
+        # Wake all blocked tasklets.
+        # They will see they were woken by a close,
+        # and raise a ChannelClosed error.
+        # Values from blocked senders are never received.
+        while self._recvq:
+            self._recvq.popleft().wake(_closed)
+        while self._sendq:
+            self._sendq.popleft()[0].wake(_closed)
 
 
 class SyncChannel(BufferedChannel):
@@ -0,0 +1,50 @@
+import multiprocessing as _multiprocessing
+
+import goless as _goless
+from .backends import current as _be
+from .channels import chan as _chan
+
+_process_pool = None
+
+
+def _get_process_pool():
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = _multiprocessing.Pool()
+    return _process_pool
+
+
+def go_thread(func, *args, **kwargs):
+    """
+    Run a function in an OS thread from the backend's thread pool.
+    Only the goroutine waiting for the result is blocked,
+    other goroutines continue to run.
+
+    If ``func`` raises an unhandled exception,
+    :func:`goless.on_panic` will be called, as for :func:`goless.go`.
+
+    :param args: Positional arguments to ``func``.
+    :param kwargs: Keyword arguments to ``func``.
+    :return: A channel that will receive the return value of ``func``.
+    """
+    result = _chan(1)
+    _goless.go(
+        lambda: result.send(_be.call_in_thread(func, *args, **kwargs)))
+    return result
+
+
+def go_process(func, *args, **kwargs):
+    """
+    Run a function in a process from a :class:`multiprocessing.Pool`,
+    with one process per CPU.
+    The pool is created the first time this is called.
+    ``func``, its arguments, and its return value must be picklable.
+
+    Otherwise, works like :func:`goless.go_thread`.
+
+    :return: A channel that will receive the return value of ``func``.
+    """
+    asyncresult = _get_process_pool().apply_async(func, args, kwargs)
+    result = _chan(1)
+    _goless.go(lambda: result.send(_be.call_in_thread(asyncresult.get)))
+    return result
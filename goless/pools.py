@@ -0,0 +1,110 @@
+import sys as _sys
+
+import goless as _goless
+from .channels import chan as _chan
+from .compat import range as _range
+from .selecting import rcase as _rcase, scase as _scase, select as _select
+
+
+class Pool(object):
+    """
+    A fixed number of goroutines that run submitted functions.
+    Use a pool instead of :func:`goless.go` when fanning out over
+    many items, so the number of goroutines stays bounded and
+    they are reused rather than spawned per item.
+
+    Functions are handed to the workers over an unbuffered channel,
+    so submitting blocks until a worker is free.
+    If a submitted function raises an unhandled exception,
+    :func:`goless.on_panic` is called, just like for a goroutine.
+
+    Call :meth:`close` when done with the pool so its goroutines exit.
+    The pool can also be used as a context manager,
+    which closes it on exit.
+
+    :param size: Number of worker goroutines.
+    """
+
+    def __init__(self, size):
+        assert isinstance(size, int) and size > 0
+        self.size = size
+        self._jobs = _chan()
+        for _ in _range(size):
+            _goless.go(self._work)
+
+    def _work(self):
+        for job in self._jobs:
+            # noinspection PyBroadException
+            try:
+                job()
+            except:
+                _goless.on_panic(*_sys.exc_info())
+
+    def submit(self, func, *args, **kwargs):
+        """
+        Run ``func(*args, **kwargs)`` on one of the pool's goroutines.
+        Blocks until a goroutine is available to run it.
+
+        :return: A channel that will receive the return value of ``func``.
+        """
+        result = _chan(1)
+        self._jobs.send(lambda: result.send(func(*args, **kwargs)))
+        return result
+
+    def imap_unordered(self, func, iterable):
+        """
+        Call ``func`` with each item in ``iterable`` on the pool's goroutines,
+        and yield the return values as they become available.
+        Items are only taken from ``iterable`` as goroutines become free.
+        """
+        results = _chan(-1)
+        pending = 0
+        for item in iterable:
+            job = _make_job(results, func, item)
+            sendcase = _scase(self._jobs, job)
+            cases = [sendcase, _rcase(results)]
+            # Keep collecting results while waiting for a free goroutine,
+            # so we don't need to hold on to them all until the end.
+            while True:
+                chosen, value = _select(cases)
+                if chosen is sendcase:
+                    pending += 1
+                    break
+                pending -= 1
+                yield value
+        for _ in _range(pending):
+            yield results.recv()
+
+    def map(self, func, iterable):
+        """
+        Call ``func`` with each item in ``iterable`` on the pool's goroutines,
+        and return a list of the return values, in the order of the items.
+        """
+        items = list(iterable)
+        results = [None] * len(items)
+
+        def call(pair):
+            index, item = pair
+            return index, func(item)
+
+        for index, value in self.imap_unordered(call, enumerate(items)):
+            results[index] = value
+        return results
+
+    def close(self):
+        """
+        Closes the pool.
+        The goroutines exit once they finish any function they are running.
+        Submitting to a closed pool raises :class:`goless.ChannelClosed`.
+        """
+        self._jobs.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+def _make_job(results, func, item):
+    return lambda: results.send(func(item))
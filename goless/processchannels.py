@@ -0,0 +1,199 @@
+import multiprocessing as _multiprocessing
+import pickle as _pickle
+import struct as _struct
+from multiprocessing import sharedctypes as _sharedctypes
+
+from .backends import current as _be
+from .channels import GoChannel as _GoChannel, ChannelClosed as _ChannelClosed
+
+# Indices into the shared header.
+# VERSION is incremented on every change to the channel,
+# so blocked parties can tell when to look at it again.
+_HEAD, _COUNT, _VERSION, _CLOSED, _SLEEPERS = range(5)
+
+# Each slot starts with the kind of payload and its length.
+_SLOT_HEADER = _struct.Struct('<BI')
+_PICKLED, _BYTES = 0, 1
+
+
+class ProcessChannel(_GoChannel):
+    """
+    A buffered channel that connects goroutines in different OS processes.
+    Values are kept in a ring buffer of fixed-size slots
+    in shared memory.
+    ``bytes`` are copied into a slot as they are,
+    other values are pickled.
+
+    A single lock guards the buffer, and is held only while a value is
+    copied in or out.
+    When a goroutine must block, it waits for the channel to change
+    in a thread (see :meth:`goless.backends.Backend.call_in_thread`),
+    so other goroutines keep running.
+    Every change to the channel wakes those threads,
+    whichever process made it.
+
+    Callers should never create this directly.
+    Use :func:`goless.process_chan`,
+    and pass the channel to child processes when they are created,
+    for example as an argument to :class:`multiprocessing.Process`.
+    """
+
+    def __init__(self, size, slot_size):
+        assert isinstance(size, int) and size > 0
+        assert isinstance(slot_size, int) and slot_size > 0
+        self.maxsize = size
+        self.slot_size = slot_size
+        self._header = _sharedctypes.RawArray('l', 5)
+        self._slots = _sharedctypes.RawArray(
+            'c', size * (_SLOT_HEADER.size + slot_size))
+        self._cond = _multiprocessing.Condition()
+        self._init_local()
+
+    def _init_local(self):
+        # State that belongs to this process only.
+        self._waiters = []
+        self._watches = {}
+        self._seen_version = self._header[_VERSION]
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        for key in ('_waiters', '_watches', '_seen_version'):
+            del state[key]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_local()
+
+    @property
+    def _closed(self):
+        return bool(self._header[_CLOSED])
+
+    def _dumps(self, value):
+        if isinstance(value, bytes):
+            kind, data = _BYTES, value
+        else:
+            kind, data = _PICKLED, _pickle.dumps(value, -1)
+        if len(data) > self.slot_size:
+            raise ValueError('Value takes %s bytes, but slots only hold %s.'
+                             % (len(data), self.slot_size))
+        return kind, data
+
+    def _slot_offset(self, index):
+        return index * (_SLOT_HEADER.size + self.slot_size)
+
+    def _changed(self):
+        # Must be called with the lock held.
+        self._header[_VERSION] += 1
+        if self._header[_SLEEPERS]:
+            self._cond.notify_all()
+
+    def _send(self, value):
+        kind, data = self._dumps(value)
+        header = self._header
+        while True:
+            with self._cond:
+                if header[_CLOSED]:
+                    raise _ChannelClosed()
+                if header[_COUNT] < self.maxsize:
+                    index = (header[_HEAD] + header[_COUNT]) % self.maxsize
+                    offset = self._slot_offset(index)
+                    start = offset + _SLOT_HEADER.size
+                    self._slots[offset:start] = _SLOT_HEADER.pack(
+                        kind, len(data))
+                    self._slots[start:start + len(data)] = data
+                    header[_COUNT] += 1
+                    self._changed()
+                    break
+                version = header[_VERSION]
+            self._wait_for_change(version)
+        if self._waiters:
+            self._notify_waiters()
+
+    def _recv(self):
+        header = self._header
+        while True:
+            with self._cond:
+                if header[_COUNT]:
+                    offset = self._slot_offset(header[_HEAD])
+                    start = offset + _SLOT_HEADER.size
+                    kind, length = _SLOT_HEADER.unpack(
+                        self._slots[offset:start])
+                    data = self._slots[start:start + length]
+                    header[_HEAD] = (header[_HEAD] + 1) % self.maxsize
+                    header[_COUNT] -= 1
+                    self._changed()
+                    break
+                if header[_CLOSED]:
+                    raise _ChannelClosed()
+                version = header[_VERSION]
+            self._wait_for_change(version)
+        if self._waiters:
+            self._notify_waiters()
+        if kind == _BYTES:
+            return data
+        return _pickle.loads(data)
+
+    def _wait_for_change(self, version, cancelled=()):
+        _be.call_in_thread(self._block_until_changed, version, cancelled)
+
+    def _block_until_changed(self, version, cancelled):
+        with self._cond:
+            self._header[_SLEEPERS] += 1
+            try:
+                while self._header[_VERSION] == version and not cancelled:
+                    self._cond.wait()
+            finally:
+                self._header[_SLEEPERS] -= 1
+
+    def recv_ready(self):
+        self._seen_version = self._header[_VERSION]
+        return self._header[_COUNT] > 0
+
+    def send_ready(self):
+        self._seen_version = self._header[_VERSION]
+        return self._header[_COUNT] < self.maxsize
+
+    def _add_waiter(self, waiter):
+        # Other processes can't wake the waiter directly,
+        # so watch for any change since the channel was last checked
+        # for readiness, and wake the waiter from here.
+        _GoChannel._add_waiter(self, waiter)
+        version = self._seen_version
+        cancelled = []
+        self._watches[waiter] = cancelled
+
+        def watch():
+            self._wait_for_change(version, cancelled)
+            if not cancelled:
+                waiter.wake()
+        _be.start(watch)
+
+    def _remove_waiter(self, waiter):
+        _GoChannel._remove_waiter(self, waiter)
+        self._watches.pop(waiter).append(True)
+        with self._cond:
+            if self._header[_SLEEPERS]:
+                self._cond.notify_all()
+
+    def close(self):
+        with self._cond:
+            self._header[_CLOSED] = 1
+            self._changed()
+        self._notify_waiters()
+
+
+def process_chan(size, slot_size=64 * 1024):
+    """
+    Returns a channel that can be used to communicate between goroutines
+    in different processes.
+    See :class:`goless.processchannels.ProcessChannel`.
+
+    :param size: Number of values the channel can buffer.
+      Must be positive, unbuffered channels are not supported.
+    :param slot_size: Maximum size in bytes of a value,
+      after it is pickled.
+      Sending a larger value raises a ``ValueError``.
+    :rtype: goless.processchannels.ProcessChannel
+    """
+    return ProcessChannel(size, slot_size)
@@ -78,16 +78,26 @@ def select(*cases):
         # noinspection PyCallingNonCallable
         return default, None
 
-    # We need to check for deadlocks before selecting.
-    # We can't rely on the underlying backend to do it,
-    # as we do for channels, since we don't do an actual send or recv here.
-    # It's possible to still have a deadlock unless we move the check into
-    # the loop, but since the check is slow
-    # (gevent doesn't provide a fast way), let's leave it out here.
-    if _be.would_deadlock():
-        raise _Deadlock('No other tasklets running, cannot select.')
     while True:
+        # Rather than polling, register a waiter with every channel
+        # and block until one of them changes state.
+        # Another tasklet may get to the ready channel before we wake up,
+        # so loop until a case is actually ready.
+        waiter = _be.waiter()
+        for c in cases:
+            c.chan._add_waiter(waiter)
+        try:
+            # We need to check for deadlocks before blocking.
+            # The backend waiter will also detect a deadlock,
+            # but checking first gives a clearer error.
+            # Check after registering, since channels that can be
+            # woken from outside this process start tasklets to watch them.
+            if _be.would_deadlock():
+                raise _Deadlock('No other tasklets running, cannot select.')
+            waiter.wait()
+        finally:
+            for c in cases:
+                c.chan._remove_waiter(waiter)
         for c in cases:
             if c.ready():
                 return c, c.exec_()
-        _be.yield_()
@@ -97,6 +97,66 @@ class CurrentBackendTests(BaseTests):
             c.receive()
 
 
+    def testWouldDeadlockTracksRunningTasklets(self):
+        w = backends.current.waiter()
+        self.assertTrue(backends.current.would_deadlock())
+        backends.current.run(w.wait)
+        self.assertFalse(backends.current.would_deadlock())
+        w.wake()
+        backends.current.yield_()
+        self.assertTrue(backends.current.would_deadlock())
+
+    def testWaiterWaitWithNoWakersRaisesDeadlock(self):
+        with self.assertRaises(backends.Deadlock):
+            backends.current.waiter().wait()
+
+    def testWaiterWakeBeforeWaitReturnsValue(self):
+        w = backends.current.waiter()
+        w.wake(1)
+        self.assertEqual(w.wait(), 1)
+
+    def testWaiterWakeDoesNotSwitch(self):
+        w = backends.current.waiter()
+        actions = []
+
+        def waiting():
+            actions.append('waiting')
+            actions.append(w.wait())
+
+        backends.current.run(waiting)
+        w.wake('woken')
+        actions.append('waker continues')
+        backends.current.yield_()
+        self.assertEqual(actions, ['waiting', 'waker continues', 'woken'])
+
+    def testWaiterOnlyFirstWakeCounts(self):
+        w = backends.current.waiter()
+        w.wake(1)
+        w.wake(2)
+        self.assertEqual(w.wait(), 1)
+
+
+class GeventBackendTests(BaseTests):
+    def setUp(self):
+        BaseTests.setUp(self)
+        if backends.current.shortname() != 'gevent':
+            self.skipTest('gevent backend not in use.')  # pragma: no cover
+
+    def testWouldDeadlockDoesNotScanHeap(self):
+        with mock.patch('gc.get_objects', side_effect=AssertionError):
+            self.assertTrue(backends.current.would_deadlock())
+
+    def testWouldDeadlockCountsGreenletThatRaised(self):
+        def raiseit():
+            raise KeyError()
+
+        grnlet = backends.current.start(raiseit)
+        self.assertFalse(backends.current.would_deadlock())
+        with mock.patch.object(grnlet.parent, 'handle_error'):
+            backends.current.yield_()
+        self.assertTrue(backends.current.would_deadlock())
+
+
 class AsDeadlockTests(BaseTests):
     def testReraises(self):
         try:
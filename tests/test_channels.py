@@ -1,3 +1,5 @@
+import mock
+
 from . import BaseTests
 
 import goless
@@ -65,6 +67,30 @@ class ChanTestMixin(object):
     def test_channel_recv_raises_when_closed(self):
         self._test_channel_raises_when_closed('recv')
 
+    def test_send_many_and_recv_many(self):
+        chan = self.makechan()
+        be.run(chan.send_many, range(5))
+        got = []
+        while len(got) < 5:
+            got.extend(chan.recv_many(5))
+        self.assertEqual(got, list(range(5)))
+
+    def test_send_many_on_closed_chan_raises(self):
+        chan = self.makechan()
+        chan.close()
+        self.assertRaises(gochans.ChannelClosed, chan.send_many, [1])
+
+    def test_recv_many_nonblocking_on_empty_chan(self):
+        chan = self.makechan()
+        self.assertEqual(chan.recv_many(5, block=False), [])
+        chan.close()
+        self.assertRaises(gochans.ChannelClosed, chan.recv_many, 5, False)
+
+    def test_recv_many_on_closed_chan_raises(self):
+        chan = self.makechan()
+        chan.close()
+        self.assertRaises(gochans.ChannelClosed, chan.recv_many, 5)
+
 
 class SyncChannelTests(BaseTests, ChanTestMixin):
     def makechan(self):
@@ -172,6 +198,70 @@ class BufferedChannelTests(BaseTests, ChanTestMixin):
         got.extend([chan.recv(), chan.recv()])
         self.assertEqual(got, [4, 3, 2, 1])
 
+    def test_nonblocking_ops_do_not_use_backend(self):
+        chan = gochans.BufferedChannel(2)
+        with mock.patch.object(be, 'waiter', side_effect=AssertionError):
+            chan.send(1)
+            chan.send(2)
+            self.assertEqual([chan.recv(), chan.recv()], [1, 2])
+
+    def test_blocked_send_raises_when_closed(self):
+        chan = gochans.BufferedChannel(1)
+        chan.send(1)
+        markers = []
+
+        def send():
+            try:
+                chan.send(2)
+            except gochans.ChannelClosed:
+                markers.append('closed')
+        be.run(send)
+        chan.close()
+        be.yield_()
+        self.assertEqual(markers, ['closed'])
+        self.assertEqual(list(chan), [1])
+
+    def test_send_many_fills_buffer_then_blocks(self):
+        chan = gochans.BufferedChannel(3)
+        markers = []
+
+        def sendall():
+            chan.send_many(range(5))
+            markers.append('sent')
+        be.run(sendall)
+        self.assertEqual(list(chan.values_deque), [0, 1, 2])
+        self.assertEqual(markers, [])
+        self.assertEqual(chan.recv_many(10), [0, 1, 2, 3])
+        self.assertEqual(list(chan.values_deque), [])
+        self.assertEqual(chan.recv(), 4)
+        be.yield_()
+        self.assertEqual(markers, ['sent'])
+
+    def test_send_many_buffers_values_after_waking_receiver(self):
+        chan = gochans.BufferedChannel(5)
+        got = []
+        be.run(lambda: got.append(chan.recv()))
+        chan.send_many([1, 2, 3])
+        self.assertEqual(got, [1])
+        self.assertEqual(list(chan.values_deque), [2, 3])
+
+    def test_recv_many_refills_buffer_from_senders(self):
+        chan = gochans.BufferedChannel(2)
+        be.run(chan.send_many, range(4))
+        self.assertEqual(chan.recv_many(1), [0])
+        self.assertEqual(list(chan.values_deque), [1, 2])
+        # The woken sender has not run yet to send its last value.
+        self.assertEqual(chan.recv_many(3), [1, 2])
+        self.assertEqual(chan.recv_many(3), [3])
+
+    def test_recv_many_blocks_for_first_value(self):
+        chan = gochans.BufferedChannel(5)
+        got = []
+        be.run(lambda: got.append(chan.recv_many(5)))
+        self.assertEqual(got, [])
+        chan.send(1)
+        self.assertEqual(got, [[1]])
+
     def test_recv_with_no_items_blocks(self):
         chan = gochans.BufferedChannel(1)
         markers = []
@@ -187,6 +277,41 @@ class BufferedChannelTests(BaseTests, ChanTestMixin):
         self.assertEqual(markers, [1, 2])
 
 
+class DebugModeTests(BaseTests):
+    def setUp(self):
+        BaseTests.setUp(self)
+        olddebug = gochans._debug
+        self.addCleanup(goless.debug, olddebug)
+
+    def test_debug_toggles_validation(self):
+        goless.debug(True)
+        self.assertTrue(gochans._debug)
+        goless.debug(False)
+        self.assertFalse(gochans._debug)
+
+    def test_invariants_not_checked_by_default(self):
+        goless.debug(False)
+        chan = gochans.BufferedChannel(1)
+        with mock.patch.object(chan, '_check_invariants') as check:
+            chan.send(1)
+            chan.recv()
+        self.assertEqual(check.call_count, 0)
+
+    def test_invalid_state_raises_in_debug_mode(self):
+        goless.debug(True)
+        chan = gochans.BufferedChannel(1)
+        chan.send(1)
+        chan.values_deque.append(2)
+        self.assertRaises(AssertionError, chan.send, 3)
+        self.assertRaises(AssertionError, chan.recv)
+
+    def test_valid_operations_pass_in_debug_mode(self):
+        goless.debug(True)
+        chan = gochans.BufferedChannel(2)
+        chan.send_many([1, 2])
+        self.assertEqual(chan.recv_many(2), [1, 2])
+
+
 class BackendChannelSenderReceiverPriorityTest(BaseTests):
     """
     Tests if the current backend channel implementation has the correct
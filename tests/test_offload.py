@@ -0,0 +1,47 @@
+import os
+import threading
+
+import goless
+from goless.backends import current as be
+from . import BaseTests
+
+
+def _raise_keyerror():
+    raise KeyError()
+
+
+class GoThreadTests(BaseTests):
+    def test_returns_result(self):
+        result = goless.go_thread(lambda a, b=0: a + b, 1, b=2)
+        self.assertEqual(result.recv(), 3)
+
+    def test_runs_in_another_thread(self):
+        result = goless.go_thread(threading.current_thread)
+        self.assertIsNot(result.recv(), threading.current_thread())
+
+    def test_does_not_block_other_goroutines(self):
+        event = threading.Event()
+        result = goless.go_thread(event.wait, 5)
+        goless.go(event.set)
+        self.assertTrue(result.recv())
+
+    def test_exc_calls_on_panic(self):
+        panics = []
+        oldpanic = goless.on_panic
+        goless.on_panic = lambda *a: panics.append(a)
+        try:
+            goless.go_thread(_raise_keyerror)
+            while not panics:
+                be.yield_()
+        finally:
+            goless.on_panic = oldpanic
+        self.assertIs(panics[0][0], KeyError)
+
+
+class GoProcessTests(BaseTests):
+    def test_runs_in_another_process(self):
+        result = goless.go_process(os.getpid)
+        self.assertNotEqual(result.recv(), os.getpid())
+
+    def test_returns_result(self):
+        self.assertEqual(goless.go_process(pow, 2, 10).recv(), 1024)
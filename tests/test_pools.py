@@ -0,0 +1,65 @@
+import goless
+from goless.backends import current as be
+from . import BaseTests
+
+
+class PoolTests(BaseTests):
+    def setUp(self):
+        BaseTests.setUp(self)
+        self.pool = goless.Pool(3)
+
+    def tearDown(self):
+        self.pool.close()
+        BaseTests.tearDown(self)
+
+    def test_submit_returns_result_channel(self):
+        result = self.pool.submit(lambda a, b=0: a + b, 1, b=2)
+        self.assertEqual(result.recv(), 3)
+
+    def test_map_preserves_order(self):
+        def negate(x):
+            be.yield_()
+            return -x
+        self.assertEqual(self.pool.map(negate, range(10)),
+                         [-x for x in range(10)])
+
+    def test_map_empty(self):
+        self.assertEqual(self.pool.map(abs, []), [])
+
+    def test_imap_unordered_yields_all_results(self):
+        got = self.pool.imap_unordered(lambda x: x * 2, range(20))
+        self.assertEqual(sorted(got), [x * 2 for x in range(20)])
+
+    def test_goroutines_are_reused(self):
+        started = []
+        with goless.Pool(2) as pool:
+            oldstart = be.start
+
+            def countstart(*args, **kwargs):
+                started.append(1)
+                return oldstart(*args, **kwargs)
+            be.start = countstart
+            try:
+                pool.map(abs, range(50))
+            finally:
+                del be.start
+        self.assertEqual(started, [])
+
+    def test_submit_on_closed_pool_raises(self):
+        self.pool.close()
+        with self.assertRaises(goless.ChannelClosed):
+            self.pool.submit(abs, 1)
+
+    def test_panic_calls_on_panic_and_keeps_worker(self):
+        panics = []
+        oldpanic = goless.on_panic
+        goless.on_panic = lambda *a: panics.append(a)
+        try:
+            with goless.Pool(1) as pool:
+                def raiseit():
+                    raise RuntimeError()
+                pool.submit(raiseit)
+                self.assertEqual(pool.submit(abs, -1).recv(), 1)
+        finally:
+            goless.on_panic = oldpanic
+        self.assertEqual(len(panics), 1)
@@ -0,0 +1,103 @@
+import multiprocessing
+
+import goless
+from goless.backends import current as be
+from goless.compat import range
+from . import BaseTests
+
+
+def _send_range(chan, count):
+    for i in range(count):
+        chan.send(i)
+    chan.close()
+
+
+def _echo(inchan, outchan):
+    for value in inchan:
+        outchan.send(value)
+    outchan.close()
+
+
+class ProcessChannelTests(BaseTests):
+    def setUp(self):
+        BaseTests.setUp(self)
+        self.chan = goless.process_chan(4)
+
+    def tearDown(self):
+        # Watches started by select exit once their thread notices,
+        # which can take a few yields.
+        for _ in range(100):
+            if be.would_deadlock():
+                break
+            be.yield_()
+        BaseTests.tearDown(self)
+
+    def test_send_and_recv_in_process(self):
+        self.chan.send({'a': 1})
+        self.chan.send(b'raw bytes')
+        self.assertEqual(self.chan.recv(), {'a': 1})
+        self.assertEqual(self.chan.recv(), b'raw bytes')
+
+    def test_ring_buffer_wraps(self):
+        for i in range(10):
+            self.chan.send_many([i, i + 1, i + 2])
+            self.assertEqual(self.chan.recv_many(3), [i, i + 1, i + 2])
+
+    def test_value_too_large_raises(self):
+        chan = goless.process_chan(1, slot_size=8)
+        self.assertRaises(ValueError, chan.send, b'123456789')
+
+    def test_close(self):
+        self.chan.send(1)
+        self.chan.close()
+        self.assertRaises(goless.ChannelClosed, self.chan.send, 2)
+        self.assertEqual(list(self.chan), [1])
+        self.assertRaises(goless.ChannelClosed, self.chan.recv)
+
+    def test_blocked_recv_does_not_block_other_goroutines(self):
+        got = []
+        be.run(lambda: got.append(self.chan.recv()))
+        goless.go(self.chan.send, 'hi')
+        while not got:
+            be.yield_()
+        self.assertEqual(got, ['hi'])
+
+    def test_blocked_send_wakes_on_recv(self):
+        goless.go(self.chan.send_many, range(8))
+        got = []
+        while len(got) < 8:
+            got.append(self.chan.recv())
+        self.assertEqual(got, list(range(8)))
+
+    def test_blocked_recv_raises_when_closed(self):
+        markers = []
+
+        def recv():
+            try:
+                self.chan.recv()
+            except goless.ChannelClosed:
+                markers.append('closed')
+        be.run(recv)
+        self.chan.close()
+        while not markers:
+            be.yield_()
+
+    def test_between_processes(self):
+        proc = multiprocessing.Process(target=_send_range, args=(self.chan, 50))
+        proc.start()
+        self.assertEqual(list(self.chan), list(range(50)))
+        proc.join()
+
+    def test_select_between_processes(self):
+        outchan = goless.process_chan(4)
+        proc = multiprocessing.Process(
+            target=_echo, args=(self.chan, outchan))
+        proc.start()
+        self.chan.send('ping')
+        case = goless.rcase(outchan)
+        chosen, value = goless.select(case)
+        self.assertIs(chosen, case)
+        self.assertEqual(value, 'ping')
+        self.chan.close()
+        self.assertRaises(goless.ChannelClosed, outchan.recv)
+        proc.join()
@@ -110,6 +110,36 @@ class SelectTests(BaseTests):
         self.assertEqual(chosen, cases[1])
         self.assertEqual(val, 5)
 
+    def test_blocked_select_does_not_poll(self):
+        chan1 = goless.chan()
+        readycalls = []
+
+        class countingcase(goless.rcase):
+            def ready(self):
+                readycalls.append(1)
+                return goless.rcase.ready(self)
+
+        case = countingcase(chan1)
+        be.run(goless.select, case)
+        callcount = len(readycalls)
+        for _ in range(5):
+            be.yield_()
+        self.assertEqual(len(readycalls), callcount)
+        chan1.send(1)
+
+    def test_select_wakes_for_send_case(self):
+        chan1 = goless.chan()
+        a = []
+        cases = [goless.scase(chan1, 'hi')]
+
+        def sel():
+            a.append(goless.select(cases))
+        be.run(sel)
+        self.assertEqual(a, [])
+        self.assertEqual(chan1.recv(), 'hi')
+        be.yield_()
+        self.assertEqual(a, [(cases[0], None)])
+
     def test_main_tasklet_can_select(self):
         chan1 = goless.chan(1)
         cases = [goless.scase(chan1, 3)]